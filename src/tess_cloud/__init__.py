@@ -19,6 +19,9 @@ log.setLevel("INFO")
 PACKAGEDIR: Path = Path(__file__).parent.absolute()
 DATADIR: Path = PACKAGEDIR / "data"
 
+# Where does this package cache files downloaded from the archives?
+CACHEDIR: Path = Path.home() / ".tess-cloud-cache"
+
 TESS_S3_BUCKET = "stpubdata"
 
 # The maximum number of downloads to await at any given time is controlled using a semaphore.
@@ -10,15 +10,17 @@ Create a catalog of TESS FFI SPOC images for Sector 10 as follows::
 import asyncio
 from pathlib import Path
 
-from astropy.io.fits import Header
-import s3fs
+from astropy.time import Time
 import pandas as pd
 from pandas import DataFrame
 import tqdm
 
-from .image import TessImage
+from .image import TessImage, _default_s3_client, _parse_header_keywords
 from . import DATADIR, log
 
+# Header keywords which are stored in the SPOC image catalogs
+SPOC_HEADER_KEYWORDS = ("CAMERA", "CCD", "DATE-OBS", "DATE-END", "DQUALITY", "BARYCORR")
+
 
 def save_spoc_ffi_catalog(sector, path=None, overwrite=False) -> DataFrame:
     if path is None:
@@ -42,16 +44,35 @@ def _spoc_catalog_path(sector: int) -> Path:
 
 async def async_get_spoc_metadata(sector=1):
     urls = list_spoc_urls(sector)
-    flist = [_get_spoc_metadata_entry(url, sector=sector) for url in urls]
-    tasks = [asyncio.create_task(f) for f in flist]
-    for t in tqdm.tqdm(
-        asyncio.as_completed(tasks), total=len(tasks), desc="Reading headers"
-    ):
-        await t
-    return pd.DataFrame([t.result() for t in tasks])
+    # Share one S3 client, and hence its open connections, between all requests
+    async with _default_s3_client() as client:
+        flist = [
+            _get_spoc_metadata_entry(url, sector=sector, client=client) for url in urls
+        ]
+        tasks = [asyncio.create_task(f) for f in flist]
+        for t in tqdm.tqdm(
+            asyncio.as_completed(tasks), total=len(tasks), desc="Reading headers"
+        ):
+            await t
+    df = pd.DataFrame([t.result() for t in tasks])
+    _add_mjd_columns(df)
+    return df
+
+
+def _add_mjd_columns(df: DataFrame):
+    """Adds the `start_mjd` and `stop_mjd` columns to an image catalog.
+
+    Storing the start and stop times as floats in the catalog allows
+    images to be selected by time without parsing the ISO strings.
+    """
+    df["start_mjd"] = Time(df.start.values.astype(str), scale="utc").mjd
+    df["stop_mjd"] = Time(df.stop.values.astype(str), scale="utc").mjd
 
 
 def list_spoc_urls(sector=1, provider="aws"):
+    # s3fs pulls in aiobotocore and aiohttp, so it is only imported when crawling
+    import s3fs
+
     fs = s3fs.S3FileSystem(anon=True)
     # urls = fs.glob(
     #    f"stpubdata/tess/public/ffi/s{sector:04d}/*/*/{camera}-{ccd}/**_ffic.fits"
@@ -75,10 +96,10 @@ def _aws_to_mast_url(url):
     )
 
 
-async def _get_spoc_metadata_entry(url, sector=-1):
+async def _get_spoc_metadata_entry(url, sector=-1, client=None):
     img = TessImage(url)
-    data_offset, hdrstr = await img._find_data_offset(return_header=True)
-    hdr = Header.fromstring(hdrstr)
+    data_offset, hdrstr = await img._find_data_offset(return_header=True, client=client)
+    hdr = _parse_header_keywords(hdrstr, SPOC_HEADER_KEYWORDS)
     return {
         "path": url.replace("stpubdata/tess/public/", ""),
         "sector": sector,  # not in FITS header!
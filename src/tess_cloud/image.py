@@ -3,21 +3,19 @@
 import asyncio
 import io
 import re
-import struct
+import sys
 import warnings
-from functools import lru_cache
-from typing import Tuple
+from functools import wraps
+from typing import TYPE_CHECKING, Tuple, Union
 
-import aiohttp
-import aioboto3
 import numpy as np
 from astropy.io import fits
 from astropy.utils.exceptions import AstropyUserWarning
-from astropy.wcs import WCS
-from astropy.time import Time
-from botocore import UNSIGNED
-from botocore.config import Config
-import backoff
+
+# The network clients and some of the astropy subpackages are slow to import,
+# so they are imported inside the functions which need them.
+if TYPE_CHECKING:
+    from astropy.wcs import WCS
 
 from . import MAX_CONCURRENT_DOWNLOADS, MAX_CONCURRENT_CUTOUTS, MAX_TCP_CONNECTIONS
 from . import USER_AGENT, TESS_S3_BUCKET, log
@@ -31,9 +29,40 @@ FFI_COLUMNS = 2136  # i.e. NAXIS1
 FFI_ROWS = 2078  # i.e. NAXIS2
 
 BYTES_PER_PIX = 4  # float32
+FFI_DTYPE = ">f4"  # FITS data is stored as big-endian float32
 
 FFI_FILENAME_REGEX = r".*-s(\d+)-(\d)-(\d)-.*"
 
+# FITS header cards are 80 characters long; the value indicator "= "
+# is found in columns 9-10 and the value itself runs up to the comment.
+FITS_CARD_SIZE = 80  # bytes
+FITS_CARD_VALUE_REGEX = re.compile(rb"\s*(?:'((?:[^']|'')*)'|([^/]*))")
+
+
+def _retry_on_connection_error(func):
+    """Retries a coroutine up to three times if the HTTP connection fails.
+
+    `backoff` and `aiohttp` are only imported when the coroutine is first called.
+    """
+    retrying_func = None
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        nonlocal retrying_func
+        if retrying_func is None:
+            import aiohttp
+            import backoff
+
+            retrying_func = backoff.on_exception(
+                backoff.constant,
+                (aiohttp.ClientError, aiohttp.ClientConnectorError),
+                interval=1,
+                max_tries=3,
+            )(func)
+        return await retrying_func(*args, **kwargs)
+
+    return wrapper
+
 
 class TessImage:
     """TESS FFI image hosted at AWS S3.
@@ -44,6 +73,24 @@ class TessImage:
         URL or filename of a TESS FFI image on AWS S3.
     """
 
+    # Using slots avoids a per-instance `__dict__`, which matters because
+    # a TessImageList may contain tens of thousands of images.
+    __slots__ = (
+        "filename",
+        "_url_dir",
+        "_s3_key",
+        "data_ext",
+        "data_offset",
+        "meta",
+        "sector",
+        "camera",
+        "ccd",
+        "time",
+        "cadenceno",
+        "quality",
+        "timecorr",
+    )
+
     def __init__(
         self,
         url,
@@ -52,11 +99,13 @@ class TessImage:
         meta=None,
     ):
         if url and "/" in url:
-            self.filename = url.split("/")[-1]
-            self._url = url
+            url_dir, self.filename = url.rsplit("/", 1)
+            # Images in the same directory share a single interned prefix string
+            self._url_dir = sys.intern(url_dir + "/")
         else:
             self.filename = url
-            self._url = None
+            self._url_dir = None
+        self._s3_key = None
 
         if data_ext is None:
             if url and "hlsp_tica" in url:
@@ -71,6 +120,14 @@ class TessImage:
             self.meta = {}
         else:
             self.meta = meta
+        # Frequently-accessed metadata is unpacked into attributes once
+        self.sector = self.meta.get("sector", np.nan)
+        self.camera = self.meta.get("camera", np.nan)
+        self.ccd = self.meta.get("ccd", np.nan)
+        self.time = self.meta.get("time", np.nan)
+        self.cadenceno = self.meta.get("cadenceno", np.nan)
+        self.quality = self.meta.get("quality", np.nan)
+        self.timecorr = self.meta.get("barycorr", np.nan)
 
     def __repr__(self):
         return f'TessImage("{self.filename}")'
@@ -93,61 +150,40 @@ class TessImage:
         else:
             return _default_http_client()
 
-    @property
-    def sector(self) -> int:
-        return self.meta.get("sector", np.nan)
-
-    @property
-    def camera(self) -> int:
-        return self.meta.get("camera", np.nan)
-
-    @property
-    def ccd(self) -> int:
-        return self.meta.get("ccd", np.nan)
-
-    @property
-    def time(self) -> str:
-        return self.meta.get("time", np.nan)
-
-    @property
-    def cadenceno(self) -> int:
-        return self.meta.get("cadenceno", np.nan)
-
-    @property
-    def quality(self) -> int:
-        return self.meta.get("quality", np.nan)
-
-    @property
-    def timecorr(self) -> float:
-        return self.meta.get("barycorr", np.nan)
-
     @property
     def url(self) -> str:
         """Returns the URL for the image at AWS S3."""
-        # if not self._url:
-        #    self._url = get_s3_uri(self.filename)
-        return self._url
+        # if not self._url_dir:
+        #    return get_s3_uri(self.filename)
+        if self._url_dir is None:
+            return None
+        return self._url_dir + self.filename
 
-    @lru_cache()
     def _get_s3_key(self) -> str:
-        return self.url.split(f"{TESS_S3_BUCKET}/")[1]
+        if self._s3_key is None:
+            self._s3_key = self.url.split(f"{TESS_S3_BUCKET}/")[1]
+        return self._s3_key
 
     async def _async_read_block_http(
         self, offset: int = None, length: int = None, client=None
     ):
-        headers = {"User-Agent": USER_AGENT}
+        # The User-Agent header is set by the client session
+        headers = {}
         if not (offset is None or length is None):
             headers["Range"] = f"bytes={offset}-{offset+length-1}"
 
         if client:
-            async with client.get(self.url, headers=headers) as resp:
-                # TODO: consider checking resp.status == 206 here?
-                return await resp.read()
+            # Use Semaphore to limit the number of concurrent downloads
+            async with MAX_CONCURRENT_DOWNLOADS:
+                async with client.get(self.url, headers=headers) as resp:
+                    # TODO: consider checking resp.status == 206 here?
+                    return await resp.read()
 
         # Making a new client for every request is slow; avoid if possible!
         async with _default_http_client() as client:
-            async with client.get(self.url, headers=headers) as resp:
-                return await resp.read()
+            async with MAX_CONCURRENT_DOWNLOADS:
+                async with client.get(self.url, headers=headers) as resp:
+                    return await resp.read()
 
     async def _async_read_block_s3(
         self, offset: int = None, length: int = None, client=None
@@ -158,17 +194,20 @@ class TessImage:
             byterange = f"bytes={offset}-{offset+length-1}"
 
         if client:
-            resp = await client.get_object(
-                Bucket=TESS_S3_BUCKET, Key=self._get_s3_key(), Range=byterange
-            )
-            return await resp["Body"].read()
+            # Use Semaphore to limit the number of concurrent downloads
+            async with MAX_CONCURRENT_DOWNLOADS:
+                resp = await client.get_object(
+                    Bucket=TESS_S3_BUCKET, Key=self._get_s3_key(), Range=byterange
+                )
+                return await resp["Body"].read()
 
         # Making a new client for every request is slow; avoid if possible!
         async with _default_s3_client() as client:
-            resp = await client.get_object(
-                Bucket=TESS_S3_BUCKET, Key=self._get_s3_key(), Range=byterange
-            )
-            return await resp["Body"].read()
+            async with MAX_CONCURRENT_DOWNLOADS:
+                resp = await client.get_object(
+                    Bucket=TESS_S3_BUCKET, Key=self._get_s3_key(), Range=byterange
+                )
+                return await resp["Body"].read()
 
     async def async_read_block(
         self, offset: int = None, length: int = None, client=None
@@ -182,13 +221,12 @@ class TessImage:
         length: int
             Number of bytes to read
         """
-        # Use Semaphore to limit the number of concurrent downloads
-        async with MAX_CONCURRENT_DOWNLOADS:
-            if self._client_type == "s3":
-                result = await self._async_read_block_s3(offset, length, client)
-            elif self._client_type == "http":
-                result = await self._async_read_block_http(offset, length, client)
-            return result
+        # Missing images do not have any bytes to read
+        if self.url is None:
+            return b""
+        if self._client_type == "s3":
+            return await self._async_read_block_s3(offset, length, client)
+        return await self._async_read_block_http(offset, length, client)
 
     def read_block(self, offset: int = None, length: int = None) -> bytes:
         """Read a block of bytes from AWS S3.
@@ -203,9 +241,21 @@ class TessImage:
         result = _sync_call(self.async_read_block, offset=offset, length=length)
         return result
 
-    def read_header(self, ext: int = None) -> fits.Header:
+    def read_header(
+        self, ext: int = None, fast: bool = False
+    ) -> Union[fits.Header, dict]:
+        """Downloads the header of an extension.
+
+        By default the header is returned as an `astropy.io.fits.Header` object.
+        Use `fast=True` to obtain a dictionary of keyword/value pairs instead,
+        obtained using a fast parser which only supports standard cards,
+        i.e. HIERARCH, CONTINUE, COMMENT, and HISTORY cards are ignored.
+        """
         if ext is None:
             ext = self.data_ext
+        if fast:
+            _, content = _sync_call(self._find_data_offset, ext=ext, return_header=True)
+            return _parse_header(content)
         content = self.read_block(0, self.data_offset)
         # Open the file and extract the fits header
         with warnings.catch_warnings():
@@ -214,8 +264,10 @@ class TessImage:
             hdr = fits.getheader(io.BytesIO(content), ext=ext)
         return hdr
 
-    def read_wcs(self, ext: int = None) -> WCS:
+    def read_wcs(self, ext: int = None) -> "WCS":
         """Downloads the image WCS."""
+        from astropy.wcs import WCS
+
         if ext is None:
             ext = self.data_ext
         return WCS(self.read_header(ext=ext))
@@ -229,7 +281,7 @@ class TessImage:
         return _sync_call(self.async_read)
 
     async def _find_data_offset(
-        self, ext: int = None, return_header: bool = False
+        self, ext: int = None, return_header: bool = False, client=None
     ) -> int:
         """Returns the byte offset of the start of the data section.
 
@@ -240,22 +292,24 @@ class TessImage:
         but not in
             https://archive.stsci.edu/hlsps/tica/s0035/cam1-ccd1/hlsp_tica_tess_ffi_s0035-o1-00147989-cam1-ccd1_tess_v01_img.fits
         """
-        if self.data_offset:
-            return self.data_offset
         if ext is None:
             ext = self.data_ext
+        # The cached offset only applies to the data extension
+        if self.data_offset and ext == self.data_ext and not return_header:
+            return self.data_offset
         # We'll assume the data starts within the first 10 FITS BLOCKs.
         # This means the method will currently only work for extensions 0 and 1 of a TESS FFI file.
         max_seek = FITS_BLOCK_SIZE * 12
-        data = await self.async_read_block(0, max_seek)
+        data = await self.async_read_block(0, max_seek, client=client)
         current_ext = 0
         offset = 0
         prev_offset = 0  # necessary to support the `return_header` feature
         while offset <= max_seek:
             block = data[offset : offset + FITS_BLOCK_SIZE]
             offset += FITS_BLOCK_SIZE
-            # Header sections end with "END" followed by whitespace until the end of the block
-            if re.search(r"END\s*$", block.decode("ascii")):
+            # Header sections end with "END" followed by whitespace until the end of the block.
+            # Comparing the raw bytes avoids decoding each block to a string.
+            if block.rstrip().endswith(b"END"):
                 if current_ext == ext:
                     log.debug(f"data_offset={offset} for {self.url}")
                     if self.data_ext == ext:
@@ -268,16 +322,16 @@ class TessImage:
                 prev_offset = offset
         return None
 
-    async def _find_pixel_offset(self, column: int, row: int) -> int:
+    async def _find_pixel_offset(self, column: int, row: int, client=None) -> int:
         """Returns the byte offset of a specific pixel position."""
-        data_offset = await self._find_data_offset(ext=self.data_ext)
+        data_offset = await self._find_data_offset(ext=self.data_ext, client=client)
         # Subtract 1 from column and row because the byte location assumes zero-indexing,
         # whereas the TESS convention is to address column and row number with one-indexing.
         pixel_offset = (column - 1) + (row - 1) * FFI_COLUMNS
         return data_offset + BYTES_PER_PIX * pixel_offset
 
     async def _find_pixel_blocks(
-        self, column: float, row: float, shape: Tuple[int, int] = (1, 1)
+        self, column: float, row: float, shape: Tuple[int, int] = (1, 1), client=None
     ) -> list:
         """Returns the byte ranges of a rectangle."""
         result = []
@@ -289,8 +343,8 @@ class TessImage:
             raise ValueError(f"row out of bounds (must be in range 0-{FFI_ROWS})")
 
         for myrow in range(row1, row1 + shape[1]):
-            begin = await self._find_pixel_offset(col1, myrow)
-            end = await self._find_pixel_offset(col1 + shape[0], myrow)
+            begin = await self._find_pixel_offset(col1, myrow, client=client)
+            end = await self._find_pixel_offset(col1 + shape[0], myrow, client=client)
             myrange = (
                 begin,
                 end - begin,
@@ -298,53 +352,88 @@ class TessImage:
             result.append(myrange)
         return result
 
-    @backoff.on_exception(
-        backoff.constant,
-        (aiohttp.ClientError, aiohttp.ClientConnectorError),
-        interval=1,
-        max_tries=3,
-    )
+    @_retry_on_connection_error
     async def _async_cutout_array(
-        self, column: float, row: float, shape: Tuple[int, int] = (5, 5), client=None
+        self,
+        column: float,
+        row: float,
+        shape: Tuple[int, int] = (5, 5),
+        client=None,
+        out: np.ndarray = None,
     ) -> np.array:
-        """Returns a 2D array of pixel values."""
+        """Returns a 2D array of pixel values with shape (rows, columns).
+
+        If `out` is given, the pixel values are written into it directly.
+        """
+        if out is None:
+            out = np.empty((shape[1], shape[0]), dtype=np.float32)
         # Avoid crashing for empty url; return empty cutout instead
         if self.url is None:
-            result = np.empty(shape)
-            result[:] = np.nan
-            return result
+            out[:] = np.nan
+            return out
 
-        blocks = await self._find_pixel_blocks(column=column, row=row, shape=shape)
+        blocks = await self._find_pixel_blocks(
+            column=column, row=row, shape=shape, client=client
+        )
         bytedata = await asyncio.gather(
             *[
                 self.async_read_block(offset=blk[0], length=blk[1], client=client)
                 for blk in blocks
             ]
         )
-        data = []
-        for b in bytedata:
-            n_pixels = len(b) // BYTES_PER_PIX
-            values = struct.unpack(">" + "f" * n_pixels, b)
-            data.append(values)
-        return np.array(data)
+        # Decode the big-endian float32 rows straight into the output array;
+        # the assignment performs the byte swap and copy in a single pass.
+        for idx, b in enumerate(bytedata):
+            out[idx] = np.frombuffer(b, dtype=FFI_DTYPE)
+        return out
 
     async def async_cutout(
-        self, column: float, row: float, shape: Tuple[int, int] = (5, 5), client=None
+        self,
+        column: float,
+        row: float,
+        shape: Tuple[int, int] = (5, 5),
+        client=None,
+        out: np.ndarray = None,
+        out_err: np.ndarray = None,
     ) -> "Cutout":
-        """Returns a cutout."""
+        """Returns a cutout.
+
+        If `out` is given, it must be a float array of shape (rows, columns)
+        into which the pixel values will be written.
+        The flux attribute of the cutout will then be a reference to `out`.
+        Likewise, `out_err` will be filled with the (unknown) flux errors.
+        """
+        if client is None and self.url is not None:
+            # Share one client, and hence its open connections, between all
+            # the requests needed to create the cutout.
+            async with self._get_default_client() as client:
+                return await self.async_cutout(
+                    column=column,
+                    row=row,
+                    shape=shape,
+                    client=client,
+                    out=out,
+                    out_err=out_err,
+                )
+
         async with MAX_CONCURRENT_CUTOUTS:
             flux = await self._async_cutout_array(
-                column=column, row=row, shape=shape, client=client
+                column=column, row=row, shape=shape, client=client, out=out
             )
 
         # Ensure we record BTJD in the TPF
         if isinstance(self.time, str):
+            from astropy.time import Time
+
             time = Time(self.time).tdb.btjd
         else:
             time = self.time
 
-        flux_err = flux.copy()
-        flux_err[:] = np.nan
+        if out_err is None:
+            flux_err = np.full_like(flux, np.nan)
+        else:
+            out_err[:] = np.nan
+            flux_err = out_err
         corner = _compute_lower_left_corner(column, row, shape)
 
         return Cutout(
@@ -408,12 +497,28 @@ class Cutout:
         self.meta = meta
 
 
-def _default_http_client():
-    conn = aiohttp.TCPConnector(limit=MAX_TCP_CONNECTIONS)
-    return aiohttp.ClientSession(connector=conn)
+def _default_http_client(limit: int = MAX_TCP_CONNECTIONS):
+    import aiohttp
+
+    # Cache DNS lookups and keep idle connections open between bursts of requests
+    conn = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+    )
+    # We do not set a total timeout because reading an entire image can be slow
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+    return aiohttp.ClientSession(
+        connector=conn, headers={"User-Agent": USER_AGENT}, timeout=timeout
+    )
 
 
 def _default_s3_client():
+    import aioboto3
+    from botocore import UNSIGNED
+    from botocore.config import Config
+
     return aioboto3.Session().client("s3", config=Config(signature_version=UNSIGNED))
 
 
@@ -426,3 +531,56 @@ def _compute_lower_left_corner(
 ) -> Tuple[int, int]:
     """Returns the (column, row) pixel coordinate of the lower left corner."""
     return (int(column) - shape[0] // 2, int(row) - shape[1] // 2)
+
+
+def _parse_header(content: bytes) -> dict:
+    """Returns the keyword/value pairs of a raw FITS header as a dictionary.
+
+    This is a fast alternative to `astropy.io.fits.Header.fromstring` which
+    only supports standard fixed-format cards, i.e. HIERARCH, CONTINUE, and
+    commentary cards (COMMENT, HISTORY) are ignored.
+    """
+    result = {}
+    for idx in range(0, len(content), FITS_CARD_SIZE):
+        card = content[idx : idx + FITS_CARD_SIZE]
+        keyword = card[:8].rstrip().decode("ascii")
+        if keyword == "END":
+            break
+        if card[8:10] != b"= ":
+            continue
+        result[keyword] = _parse_card_value(card[10:])
+    return result
+
+
+def _parse_header_keywords(hdrstr: bytes, keywords: tuple) -> dict:
+    """Returns the header of an image as a dictionary which contains `keywords`.
+
+    The fast `_parse_header` is used, unless it misses one of the keywords,
+    in which case the header is parsed by astropy instead.
+    """
+    hdr = _parse_header(hdrstr)
+    if all(key in hdr for key in keywords):
+        return hdr
+    return fits.Header.fromstring(hdrstr)
+
+
+def _parse_card_value(value: bytes):
+    """Converts the raw value of a FITS header card into a Python object."""
+    match = FITS_CARD_VALUE_REGEX.match(value)
+    if match.group(1) is not None:
+        return match.group(1).replace(b"''", b"'").rstrip().decode("ascii")
+    value = match.group(2).strip()
+    if value == b"T":
+        return True
+    elif value == b"F":
+        return False
+    elif value == b"":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value.replace(b"D", b"E"))
+    except ValueError:
+        return value.decode("ascii")
@@ -1,8 +1,10 @@
 import asyncio
 from collections import UserList
+from functools import lru_cache
 from typing import Union, Tuple
 
 from astropy.time import Time
+import numpy as np
 from pandas import DataFrame
 import tqdm
 
@@ -52,6 +54,17 @@ class TessImageList(UserList):
         ]
         return DataFrame(data)
 
+    def copy(self) -> "TessImageList":
+        obj = self.__class__(self)
+        if hasattr(self, "_catalog"):
+            obj._catalog = self._catalog
+        return obj
+
+    @classmethod
+    def from_urls(cls, urls):
+        """Returns a list of images given an iterable of URLs."""
+        return cls([TessImage(url) for url in urls])
+
     @classmethod
     def from_catalog(cls, catalog: DataFrame):
         series = catalog.apply(
@@ -73,16 +86,35 @@ class TessImageList(UserList):
         # If all images are None, the client type doesn't matter
         return img._get_default_client(client_type="s3")
 
-    async def _get_cutouts(self, crdlist: TessCoordList, shape: Tuple[int, int]):
+    async def _get_cutouts(
+        self,
+        crdlist: TessCoordList,
+        shape: Tuple[int, int],
+        out: np.ndarray = None,
+        out_err: np.ndarray = None,
+    ):
+        """Returns the list of cutouts.
+
+        If `out` is given, it must be an array of shape (n_images, rows, columns)
+        into which the pixel values of the cutouts will be written.
+        `out_err` is an optional array of the same shape for the flux errors.
+        """
         if len(self) == 0:
             return []
+        if out is None:
+            out = np.empty((len(self), shape[1], shape[0]), dtype=np.float32)
         async with self._get_default_client() as client:
             # Create list of functions to be executed
             flist = [
                 img.async_cutout(
-                    column=crd.column, row=crd.row, shape=shape, client=client
+                    column=crd.column,
+                    row=crd.row,
+                    shape=shape,
+                    client=client,
+                    out=out[idx],
+                    out_err=None if out_err is None else out_err[idx],
                 )
-                for img, crd in zip(self, crdlist)
+                for idx, (img, crd) in enumerate(zip(self, crdlist))
             ]
             # Create tasks for the sake of allowing a progress bar to be shown.
             # We'd want to use `asyncio.gather(*flist)` here to obtain the results in order,
@@ -115,8 +147,13 @@ class TessImageList(UserList):
         return self.moving_cutout(crdlist=crdlist, shape=shape)
 
     def moving_cutout(self, crdlist: TessCoordList, shape: Tuple[int, int] = (5, 5)):
-        cutouts = asyncio.run(self._get_cutouts(crdlist=crdlist, shape=shape))
-        tpf = TargetPixelFile.from_cutouts(cutouts)
+        # The cutouts write their pixels directly into the flux cubes of the TPF
+        flux = np.empty((len(self), shape[1], shape[0]), dtype=np.float32)
+        flux_err = np.empty_like(flux)
+        cutouts = asyncio.run(
+            self._get_cutouts(crdlist=crdlist, shape=shape, out=flux, out_err=flux_err)
+        )
+        tpf = TargetPixelFile.from_cutouts(cutouts, flux=flux, flux_err=flux_err)
         return tpf.to_lightkurve()
 
 
@@ -128,7 +165,24 @@ def list_images(
     author: str = "spoc",
     provider: str = None,
 ) -> TessImageList:
-    """Returns the list of FFI images."""
+    """Returns the list of FFI images.
+
+    Results are cached in memory; each call returns a new list
+    which shares the underlying `TessImage` objects with the cache.
+    """
+    # Key the cache on the MJD of `time` because `Time` objects are not hashable
+    mjd = None if time is None else float(Time(time).utc.mjd)
+    images = _list_images(
+        sector=sector, camera=camera, ccd=ccd, mjd=mjd, author=author, provider=provider
+    )
+    return images.copy()
+
+
+@lru_cache(maxsize=256)
+def _list_images(
+    sector: int, camera: int, ccd: int, mjd: float, author: str, provider: str
+) -> TessImageList:
+    time = None if mjd is None else Time(mjd, format="mjd", scale="utc")
     if author == "tica":
         from . import tica
 
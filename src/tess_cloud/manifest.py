@@ -7,90 +7,213 @@ As of Feb 27, 2021, the manifest file does not appear to have been
 updated since sector 26, so these functions won't work for recent sectors.
 """
 from functools import lru_cache
-import io
+import gzip
 import os
+import re
+import time
+from typing import Callable, Tuple
 
 import boto3
 from botocore import UNSIGNED
 from botocore.config import Config
 
-import diskcache
+import numpy as np
 import pandas as pd
 
+from . import CACHEDIR
+
 
 __all__ = ["list_images", "get_s3_uri"]
 
 # Setup the disk cache
-CACHEDIR = os.path.join(os.path.expanduser("~"), ".tess-cloud-cache")
-cache = diskcache.Cache(directory=CACHEDIR)
+CACHE_EXPIRE = 86400  # seconds
+MANIFEST_NAMES_PATH = os.path.join(CACHEDIR, "manifest-lookup-names.npy")
+MANIFEST_PATHS_PATH = os.path.join(CACHEDIR, "manifest-lookup-paths.npy")
+
+
+# The S3 path of a calibrated FFI can be derived from its filename,
+# e.g. "tess2019142115932-s0012-2-1-0144-s_ffic.fits" is found in
+# "tess/public/ffi/s0012/2019/142/2-1/".
+FFI_FILENAME_REGEX = re.compile(
+    r"tess(\d{4})(\d{3})\d+-s(\d{4})-(\d)-(\d)-\d+-._ffic\.fits"
+)
+FFI_PATH_TEMPLATE = "tess/public/ffi/s{sector}/{year}/{doy}/{camera}-{ccd}/{filename}"
+
+
+def _is_cached(path: str) -> bool:
+    """Returns True if `path` exists and has not yet expired."""
+    return os.path.exists(path) and time.time() - os.path.getmtime(path) < CACHE_EXPIRE
+
+
+def _parquet_cache(
+    key: str, builder: Callable[[], pd.DataFrame], **read_kwargs
+) -> pd.DataFrame:
+    """Returns the dataframe cached in `CACHEDIR/{key}.parquet`.
+
+    If the file does not exist or has expired, `builder()` is called to
+    create the dataframe, which is then written using dictionary-encoded
+    zstd compression; this suits the long, repetitive paths in the manifest.
+    Any keyword arguments (e.g. `filters`) are passed to `pd.read_parquet`.
+    """
+    path = os.path.join(CACHEDIR, f"{key}.parquet")
+    if not _is_cached(path):
+        df = builder()
+        os.makedirs(CACHEDIR, exist_ok=True)
+        # Write to a temporary file first, so an interrupted build is never cached
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        df.to_parquet(
+            tmp_path,
+            index=False,
+            compression="zstd",
+            use_dictionary=True,
+            row_group_size=50_000,
+        )
+        os.replace(tmp_path, path)
+    return pd.read_parquet(path, **read_kwargs)
 
 
 def get_boto3_client():
     return boto3.client("s3", config=Config(signature_version=UNSIGNED))
 
 
-def _load_manifest():
-    """Returns `tess/public/manifest.txt.gz` as a dataframe.
+def _load_manifest(suffix: str = None, chunksize: int = 500_000):
+    """Returns the `path` column of `tess/public/manifest.txt.gz` as a dataframe.
+
+    The file is decompressed and parsed in chunks while it is being downloaded,
+    rather than buffering the entire compressed file in memory first.
+    If `suffix` is given, only the paths ending with `suffix` are retained,
+    so that the full manifest never needs to be held in memory.
 
     This function is slow!  Use `load_manifest_lookup` for a cached lookup table.
     """
     s3c = get_boto3_client()
     obj = s3c.get_object(Bucket="stpubdata", Key="tess/public/manifest.txt.gz")
-    df = pd.read_table(
-        io.BytesIO(obj["Body"].read()),
-        compression="gzip",
-        names=["modified_date", "modified_time", "size", "path"],
-        delim_whitespace=True,
-    )
-    return df
+    with gzip.GzipFile(fileobj=obj["Body"]) as gz:
+        reader = pd.read_csv(
+            gz,
+            sep=r"\s+",
+            header=None,
+            names=["modified_date", "modified_time", "size", "path"],
+            usecols=["path"],
+            engine="c",
+            chunksize=chunksize,
+        )
+        chunks = [
+            chunk if suffix is None else chunk[chunk.path.str.endswith(suffix)]
+            for chunk in reader
+        ]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _build_ffi_manifest() -> pd.DataFrame:
+    """Returns the calibrated FFI files listed in the manifest.
+
+    The sector, camera, and ccd numbers are parsed from the filenames once
+    and stored as integer columns.  The table is sorted by these columns,
+    so that the row group statistics of the cached Parquet file allow a
+    query for a single sector/camera/ccd to skip most of the file.
+    """
+    # Filter out the calibrated FFI FITS files
+    ffi_files = _load_manifest(suffix="ffic.fits")
+    numbers = ffi_files.path.str.extract(r"tess\d+-s(\d+)-(\d)-(\d)-").dropna()
+    ffi_files = ffi_files.loc[numbers.index].copy()
+    ffi_files[["sector", "camera", "ccd"]] = numbers.astype("int16").values
+    return ffi_files.sort_values(["sector", "camera", "ccd", "path"])
 
 
 @lru_cache(maxsize=None)  # in-memory cache
-def _load_ffi_manifest():
-    """Returns the calibrated FFI files listed in `tess/public/manifest.txt.gz` as a dataframe."""
-    df = _load_manifest()
-    # Filter out the calibrated FFI FITS files
-    ffi_files = df[df.path.str.endswith("ffic.fits")]
-    return ffi_files
+def _load_ffi_manifest(
+    sector: int = None, camera: int = None, ccd: int = None
+) -> pd.DataFrame:
+    """Returns the calibrated FFI files listed in `tess/public/manifest.txt.gz` as a dataframe.
+
+    The optional sector, camera, and ccd arguments are pushed down
+    into the Parquet reader, so that only the relevant rows are read.
+    """
+    filters = [
+        (column, "==", value)
+        for column, value in (("sector", sector), ("camera", camera), ("ccd", ccd))
+        if value is not None
+    ]
+    return _parquet_cache("ffi-manifest", _build_ffi_manifest, filters=filters or None)
 
 
 @lru_cache(maxsize=None)  # in-memory cache
 def _load_tpf_manifest():
     """Returns the Target Pixel Files listed in `tess/public/manifest.txt.gz` as a dataframe."""
-    df = _load_manifest()
-    # Filter out the calibrated FFI FITS files
-    ffi_files = df[df.path.str.endswith("tp.fits")]
-    return ffi_files
+    # Filter out the Target Pixel Files
+    return _parquet_cache("tpf-manifest", lambda: _load_manifest(suffix="tp.fits"))
+
 
+def _save_manifest_lookup(
+    names_path: str = MANIFEST_NAMES_PATH, paths_path: str = MANIFEST_PATHS_PATH
+):
+    """Writes the filename => path lookup table to disk.
 
-@cache.memoize(expire=86400)  # persistent on-disk cache
-def _load_manifest_lookup() -> dict:
-    """Returns a hashtable mapping filename => S3 URI"""
+    The table is stored as two fixed-width string arrays sorted by filename,
+    which allows lookups to be resolved using a binary search
+    without creating a Python object for every entry.
+    """
     ffi_files = _load_ffi_manifest()
-    # Make a lookup hashtable which maps filename => path
-    lookup = dict(zip(ffi_files.path.str.split("/").str[-1], ffi_files.path))
-    return lookup
+    paths = ffi_files.path.values.astype(str)
+    filenames = np.array([p.rsplit("/", 1)[-1] for p in paths])
+    order = np.argsort(filenames)
+    os.makedirs(os.path.dirname(names_path), exist_ok=True)
+    # Both arrays are written to temporary files before either is replaced;
+    # the names file is replaced last, so it is never older than the paths file
+    # unless the pair was left incomplete.
+    for path, array in ((paths_path, paths[order]), (names_path, filenames[order])):
+        with open(f"{path}.{os.getpid()}.tmp", "wb") as out:
+            np.save(out, array)
+    for path in (paths_path, names_path):
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
 
 
-@lru_cache(maxsize=None)  # faster in-memory cache
-def load_manifest_lookup() -> dict:
-    return _load_manifest_lookup()
+@lru_cache(maxsize=None)  # in-memory cache
+def load_manifest_lookup() -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the sorted `(filenames, paths)` arrays which map filename => path.
+
+    The arrays are memory-mapped, so only the pages touched by a lookup are read.
+    """
+    names_path, paths_path = MANIFEST_NAMES_PATH, MANIFEST_PATHS_PATH
+    if not (
+        _is_cached(names_path)
+        and _is_cached(paths_path)
+        and os.path.getmtime(names_path) >= os.path.getmtime(paths_path)
+    ):
+        _save_manifest_lookup(names_path, paths_path)
+    return np.load(names_path, mmap_mode="r"), np.load(paths_path, mmap_mode="r")
 
 
 def get_s3_uri(filename: str) -> str:
-    """Returns the S3 URI of a TESS data product given its filename."""
-    lookup = load_manifest_lookup()
-    return "s3://stpubdata/" + lookup[filename]
+    """Returns the S3 URI of a TESS data product given its filename.
+
+    Only calibrated FFIs are supported.  Their path is usually derived from
+    the filename directly; the manifest is only consulted for FFI filenames
+    which do not follow the standard pattern.
+    """
+    match = FFI_FILENAME_REGEX.fullmatch(filename)
+    if match:
+        year, doy, sector, camera, ccd = match.groups()
+        return "s3://stpubdata/" + FFI_PATH_TEMPLATE.format(
+            sector=sector,
+            year=year,
+            doy=doy,
+            camera=camera,
+            ccd=ccd,
+            filename=filename,
+        )
+    # The manifest lookup only contains calibrated FFIs
+    if not filename.endswith("ffic.fits"):
+        raise KeyError(filename)
+    names, paths = load_manifest_lookup()
+    idx = np.searchsorted(names, filename)
+    if idx >= len(names) or names[idx] != filename:
+        raise KeyError(filename)
+    return "s3://stpubdata/" + paths[idx]
 
 
 def list_images(sector: int, camera: int = None, ccd: int = None):
     """Returns a list of the FFIs for a given sector/camera/ccd."""
-    if camera is None:
-        camera = r"\d"  # regex
-    if ccd is None:
-        ccd = r"\d"  # regex
-    ffi_files = _load_ffi_manifest()
-    mask = ffi_files.path.str.match(
-        rf".*tess(\d+)-s{sector:04d}-{camera}-{ccd}-\d+-._ffic.fits"
-    )
-    return ffi_files[mask].path.str.split("/").str[-1].values.tolist()
+    ffi_files = _load_ffi_manifest(sector=sector, camera=camera, ccd=ccd)
+    return [p.rsplit("/", 1)[-1] for p in ffi_files.path.values]
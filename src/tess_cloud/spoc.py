@@ -6,8 +6,6 @@ import pandas as pd
 from pandas import DataFrame
 import numpy as np
 
-from .manifest import _load_ffi_manifest
-from .image import TessImage
 from .imagelist import TessImageList
 from . import crawler, log
 
@@ -34,49 +32,70 @@ def list_spoc_images(
         "mast", "aws", or "mock".
         Defaults to "aws".
     """
-    df = _load_spoc_ffi_catalog(sector=sector)
-    if camera:
-        df = df[df.camera == camera]
-    if ccd:
-        df = df[df.ccd == ccd]
+    df = _load_spoc_ffi_catalog(sector=sector, camera=camera, ccd=ccd)
     if time:
-        if isinstance(time, str):
-            time = Time(time)
-        begin = Time(np.array(df.start, dtype=str))
-        end = Time(np.array(df.stop, dtype=str))
-        mask = (time >= begin) & (time <= end)
+        mjd = Time(time).utc.mjd
+        mask = (df.start_mjd.values <= mjd) & (mjd <= df.stop_mjd.values)
         if not any(mask):
             return TessImageList([])
         df = df[mask]
 
     if provider == "mast":
-        df["path"] = SPOC_MAST_PREFIX + df["path"]
+        prefix = SPOC_MAST_PREFIX
     elif provider == "mock":
-        df["path"] = SPOC_MOCK_PREFIX + df["path"]
+        prefix = SPOC_MOCK_PREFIX
     else:
-        df["path"] = SPOC_AWS_PREFIX + df["path"]
+        prefix = SPOC_AWS_PREFIX
+
+    # Use `assign` to avoid modifying the cached catalog in place
+    df = df.assign(
+        path=prefix + df["path"],
+        # Add time column (TODO: move this to save_catalog)
+        time=_mid_times(df).iso,
+        # Problem: CADENCENO does not appear in SPOC FFI headers =(
+        cadenceno=np.zeros(len(df), dtype=int),
+    )
 
-    # Add time column (TODO: move this to save_catalog)
-    duration = Time(df.stop.iloc[0]) - Time(df.start.iloc[0])
-    timeobj = Time(df.start.values.astype(str)) + (duration / 2)
-    df["time"] = timeobj.iso
+    return TessImageList.from_catalog(df)
 
-    # Problem: CADENCENO does not appear in SPOC FFI headers =(
-    df["cadenceno"] = np.zeros(len(df), dtype=int)
 
-    return TessImageList.from_catalog(df)
+def _load_spoc_ffi_catalog(
+    sector: int, camera: int = None, ccd: int = None
+) -> DataFrame:
+    """Returns the SPOC image catalog of a sector, optionally for one camera/ccd."""
+    df = _read_spoc_ffi_catalog(sector=sector)
+    if camera:
+        df = df[df.camera.values == camera]
+    if ccd:
+        df = df[df.ccd.values == ccd]
+    return df
 
 
 @lru_cache()
-def _load_spoc_ffi_catalog(sector: int) -> DataFrame:
+def _read_spoc_ffi_catalog(sector: int) -> DataFrame:
+    """Returns the full SPOC image catalog of a sector.
+
+    The catalog is cached per sector, so that the file is read and the MJD
+    columns are computed only once for all cameras and ccds.
+    """
     try:
         path = crawler._spoc_catalog_path(sector=sector)
         log.debug(f"Reading {path}")
-        return pd.read_parquet(path)
+        df = pd.read_parquet(path)
     except FileNotFoundError:
         raise ValueError(
             f"The SPOC image catalog for sector {sector} is not available in this version of tess-cloud."
         )
+    # Catalogs created by older versions of the crawler lack the MJD columns
+    if "start_mjd" not in df:
+        crawler._add_mjd_columns(df)
+    return df
+
+
+def _mid_times(df: DataFrame) -> Time:
+    """Returns the mid-exposure times of the images in a catalog."""
+    duration = df.stop_mjd.values[0] - df.start_mjd.values[0]
+    return Time(df.start_mjd.values + duration / 2, format="mjd", scale="utc")
 
 
 def get_image_time(sector, camera=1, ccd=1) -> Time:
@@ -84,10 +103,8 @@ def get_image_time(sector, camera=1, ccd=1) -> Time:
 
     Be aware that the times depend on camera and ccd number.
     """
-    df = _load_spoc_ffi_catalog(sector=sector)
-    df2 = df.query(f"camera == {camera} & ccd == {ccd}")
-    duration = Time(df2.stop.iloc[0]) - Time(df2.start.iloc[0])
-    return Time(df2.start.values.astype(str)) + (duration / 2)
+    df = _load_spoc_ffi_catalog(sector=sector, camera=camera, ccd=ccd)
+    return _mid_times(df)
 
 
 ###
@@ -113,22 +130,11 @@ def _list_spoc_images_mast(sector, camera=r"\d", ccd=r"\d"):
     mask = df.url.str.match(
         rf".*tess(\d+)-s{sector:04d}-{camera}-{ccd}-\d+-._ffic.fits"
     )
-    return TessImageList([TessImage(url) for url in df[mask].url.values])
+    return TessImageList.from_urls(df.url.values[np.flatnonzero(mask)])
     # except HTTPError:
     #    return TessImageList([])
 
 
-def _list_spoc_images_aws(sector, camera=r"\d", ccd=r"\d"):
-    """Returns a list of the FFIs for a given sector/camera/ccd."""
-    ffi_files = _load_ffi_manifest()
-    mask = ffi_files.path.str.match(
-        rf".*tess(\d+)-s{sector:04d}-{camera}-{ccd}-\d+-._ffic.fits"
-    )
-    return TessImageList(
-        [TessImage("s3://stpubdata/" + x) for x in ffi_files[mask].path.values]
-    )
-
-
 @lru_cache()
 def _get_mast_bundle(sector: int):
     bundle_url = f"https://archive.stsci.edu/missions/tess/download_scripts/sector/tesscurl_sector_{sector}_ffic.sh"
@@ -15,7 +15,11 @@ ColDefs(
     name = 'POS_CORR2'; format = 'E'; unit = 'pixel'; disp = 'E14.7'
 )
 """
+import io
+import os
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
 from typing import Optional
 
 import numpy as np
@@ -61,12 +65,10 @@ class TargetPixelFile:
         self.flux_err = flux_err
         self.flux_bkg = flux_bkg
         if self.flux_bkg is None:
-            self.flux_bkg = np.empty(shape=flux.shape)
-            self.flux_bkg[:] = np.nan
+            self.flux_bkg = np.full(flux.shape, np.nan, dtype=np.float32)
         self.flux_bkg_err = flux_bkg_err
         if self.flux_bkg_err is None:
-            self.flux_bkg_err = np.empty(shape=flux.shape)
-            self.flux_bkg_err[:] = np.nan
+            self.flux_bkg_err = np.full(flux.shape, np.nan, dtype=np.float32)
         self.wcs = wcs
 
         meta_default = {
@@ -80,11 +82,14 @@ class TargetPixelFile:
         self.meta = meta_default
 
         self._optional_column_data = {}
+        self._optional_column_specs = {}
+        self._fits = None
 
     def add_column(self, name, array, colspec=None):
         self._optional_column_data[name] = array
         if colspec:
-            TPF_OPTIONAL_COLUMNS[name] = colspec
+            # Custom specs are stored per instance to leave the module defaults intact
+            self._optional_column_specs[name] = colspec
 
     @property
     def n_cadences(self):
@@ -92,98 +97,147 @@ class TargetPixelFile:
 
     @property
     def n_columns(self):
-        return self.flux.shape[1]
+        return self.flux.shape[2]
 
     @property
     def n_rows(self):
-        return self.flux.shape[2]
+        return self.flux.shape[1]
 
-    @property
+    @cached_property
     def timecorr(self):
-        if not hasattr(self, "_timecorr"):
-            self._timecorr = np.zeros(self.n_cadences, dtype="float32")
-        return self._timecorr
+        return np.zeros(self.n_cadences, dtype="float32")
 
-    @property
+    @cached_property
     def raw_cnts(self):
-        if not hasattr(self, "_raw_cnts"):
-            self._raw_cnts = np.empty(
-                (self.n_cadences, self.n_rows, self.n_columns), dtype="int"
-            )
-            self._raw_cnts[:, :, :] = -1
-        return self._raw_cnts
+        return np.full(
+            (self.n_cadences, self.n_rows, self.n_columns), -1, dtype="int32"
+        )
 
-    @property
+    @cached_property
     def pos_corr1(self):
-        if not hasattr(self, "_pos_corr1"):
-            self._pos_corr1 = np.zeros(self.n_cadences, dtype="float32")
-        return self._pos_corr1
+        return np.zeros(self.n_cadences, dtype="float32")
 
-    @property
+    @cached_property
     def pos_corr2(self):
-        if not hasattr(self, "_pos_corr2"):
-            self._pos_corr2 = np.zeros(self.n_cadences, dtype="float32")
-        return self._pos_corr2
+        return np.zeros(self.n_cadences, dtype="float32")
 
     @staticmethod
-    def from_cutouts(images: list) -> "TargetPixelFile":
+    def from_cutouts(
+        images: list, flux: ndarray = None, flux_err: ndarray = None
+    ) -> "TargetPixelFile":
+        """Creates a TPF from a list of cutouts.
+
+        If the cutouts were written into pre-allocated arrays of shape
+        (n_cadences, rows, columns), they can be passed as `flux` and `flux_err`
+        to avoid a copy.
+        """
         if len(images) > 0:
             shape = (len(images), images[0].flux.shape[0], images[0].flux.shape[1])
         else:
             shape = (0, 0, 0)
-        flux = np.empty(shape)
-        flux_err = np.empty(shape)
+        # The FLUX and FLUX_ERR columns are single precision ("E") in the FITS file
+        if flux_err is None:
+            flux_err = np.full(shape, np.nan, dtype=np.float32)
+        copy_flux = flux is None
+        if copy_flux:
+            flux = np.empty(shape, dtype=np.float32)
+
+        # Collect the pixels and all per-cadence attributes in a single pass
+        names = (
+            "TIME",
+            "TIMECORR",
+            "CADENCENO",
+            "QUALITY",
+            "SECTOR",
+            "CAMERA",
+            "CCD",
+            "CORNER_COLUMN",
+            "CORNER_ROW",
+            "TARGET_COLUMN",
+            "TARGET_ROW",
+            "URL",
+        )
+        getter = attrgetter(*[name.lower() for name in names])
+        rows = []
         for idx, img in enumerate(images):
-            flux[idx] = img.flux
-            flux_err[idx] = np.nan
+            if copy_flux:
+                flux[idx] = img.flux
+            rows.append(getter(img))
+
+        # Cast each column to the dtype of its FITS format once, here
+        columns = {}
+        for name, values in zip(names, zip(*rows) if rows else [()] * len(names)):
+            if name == "TIME":
+                dtype = np.float64
+            else:
+                dtype = _column_dtype(TPF_OPTIONAL_COLUMNS[name]["format"])
+            try:
+                columns[name] = np.fromiter(values, dtype=dtype, count=len(values))
+            except (TypeError, ValueError):
+                # e.g. the NaN values of missing images in integer columns
+                columns[name] = np.asarray(values).astype(dtype)
 
-        time = np.array([img.time for img in images])
         tpf = TargetPixelFile(
-            time=time,
+            time=columns.pop("TIME"),
             flux=flux,
             flux_err=flux_err,
         )
-
-        tpf.add_column(
-            name="TIMECORR", array=np.array([img.timecorr for img in images])
-        )
-        tpf.add_column(
-            name="CADENCENO", array=np.array([img.cadenceno for img in images])
-        )
-        tpf.add_column(name="QUALITY", array=np.array([img.quality for img in images]))
-        tpf.add_column(name="SECTOR", array=np.array([img.sector for img in images]))
-        tpf.add_column(name="CAMERA", array=np.array([img.camera for img in images]))
-        tpf.add_column(name="CCD", array=np.array([img.ccd for img in images]))
-        tpf.add_column(
-            name="CORNER_COLUMN", array=np.array([img.corner_column for img in images])
-        )
-        tpf.add_column(
-            name="CORNER_ROW", array=np.array([img.corner_row for img in images])
-        )
-        tpf.add_column(
-            name="TARGET_COLUMN", array=np.array([img.target_column for img in images])
-        )
-        tpf.add_column(
-            name="TARGET_ROW", array=np.array([img.target_row for img in images])
-        )
-        tpf.add_column(name="URL", array=np.array([img.url for img in images]))
+        for name, array in columns.items():
+            tpf.add_column(name=name, array=array)
         return tpf
 
     @staticmethod
     def read(path) -> "TargetPixelFile":
-        f = fits.open(path)
+        """Reads a TPF written by `TargetPixelFile.write`.
+
+        The columns are memory-mapped, so the pixel data is only read from disk
+        when accessed. Use `close()` to release the file.
+        """
+        f = fits.open(path, memmap=True, mode="denywrite")
+        table = f[1].data
+        names = f[1].columns.names
         tpf = TargetPixelFile(
-            time=f[1].data["TIME"],
-            cadenceno=f[1].data["CADENCENO"],
-            flux=f[1].data["FLUX"],
-            flux_err=f[1].data["FLUX_ERR"],
-            quality=f[1].data["QUALITY"],
+            time=table["TIME"],
+            flux=table["FLUX"],
+            flux_err=table["FLUX_ERR"],
+            flux_bkg=table["FLUX_BKG"] if "FLUX_BKG" in names else None,
+            flux_bkg_err=table["FLUX_BKG_ERR"] if "FLUX_BKG_ERR" in names else None,
         )
+        if "RAW_CNTS" in names:
+            tpf.raw_cnts = table["RAW_CNTS"]
+        for name in TPF_OPTIONAL_COLUMNS:
+            if name in names:
+                tpf.add_column(name=name, array=table[name])
+        # Keep a reference to the file to prevent the memory map from being closed
+        tpf._fits = f
         return tpf
 
-    def write(self, *args, **kwargs):
+    def close(self):
+        """Closes the FITS file which backs a TPF created by `read`."""
+        if self._fits is not None:
+            self._fits.close()
+            self._fits = None
+
+    def write(self, path, overwrite=False, **kwargs):
+        """Writes the TPF to a FITS file.
+
+        The file is serialized in memory and written to disk in a single call,
+        which avoids many small writes on network file systems.
+        Paths ending in ".gz" or ".bz2" are compressed by astropy instead.
+        """
+        # The table is built in memory, so checksums and verification are not needed
+        kwargs.setdefault("checksum", False)
+        kwargs.setdefault("output_verify", "ignore")
         hdulist = self._create_hdulist()
-        return hdulist.writeto(*args, **kwargs)
+        # Let astropy handle file objects and compressed files (e.g. ".fits.gz")
+        if not isinstance(path, (str, os.PathLike)) or str(path).endswith(
+            (".gz", ".bz2")
+        ):
+            return hdulist.writeto(path, overwrite=overwrite, **kwargs)
+        buf = io.BytesIO()
+        hdulist.writeto(buf, **kwargs)
+        with open(os.path.expanduser(path), "wb" if overwrite else "xb") as out:
+            out.write(buf.getbuffer())
 
     def to_lightkurve(self, quality_bitmask=0):
         return lk.TessTargetPixelFile(
@@ -206,82 +260,56 @@ class TargetPixelFile:
         hdu.header.update(self.meta)
         return hdu
 
-    @property
-    def _coldim(self):
-        return "({},{})".format(self.n_columns, self.n_rows)
-
-    @property
-    def _eformat(self):
-        return "{}E".format(self.n_rows * self.n_columns)
-
     def _create_table_extension(self):
-        """Create the 'TARGETTABLES' extension (i.e. extension #1)."""
-        # Turn the data arrays into fits columns and initialize the HDU
-        jformat = "{}J".format(self.n_rows * self.n_columns)
-        cols = []
-        cols.append(
-            fits.Column(name="TIME", format="D", unit="BJD - 2457000", array=self.time)
-        )
-        cols.append(
-            fits.Column(
-                name="RAW_CNTS",
-                format=jformat,
-                unit="count",
-                dim=self._coldim,
-                array=self.raw_cnts,
-            )
-        )
-        cols.append(
-            fits.Column(
-                name="FLUX",
-                format=self._eformat,
-                unit="e-/s",
-                dim=self._coldim,
-                array=self.flux,
-            )
-        )
-        cols.append(
-            fits.Column(
-                name="FLUX_ERR",
-                format=self._eformat,
-                unit="e-/s",
-                dim=self._coldim,
-                array=self.flux_err,
-            )
-        )
-        cols.append(
-            fits.Column(
-                name="FLUX_BKG",
-                format=self._eformat,
-                unit="e-/s",
-                dim=self._coldim,
-                array=self.flux_bkg,
-            )
-        )
-        cols.append(
-            fits.Column(
-                name="FLUX_BKG_ERR",
-                format=self._eformat,
-                unit="e-/s",
-                dim=self._coldim,
-                array=self.flux_bkg_err,
-            )
-        )
-
+        """Create the 'TARGETTABLES' extension (i.e. extension #1).
+
+        The columns are written into a single big-endian structured array,
+        which the HDU wraps without making another copy.
+        """
+        # (name, format, unit, array) of each column
+        columns = [
+            ("TIME", "D", "BJD - 2457000", self.time),
+            ("RAW_CNTS", "J", "count", self.raw_cnts),
+            ("FLUX", "E", "e-/s", self.flux),
+            ("FLUX_ERR", "E", "e-/s", self.flux_err),
+            ("FLUX_BKG", "E", "e-/s", self.flux_bkg),
+            ("FLUX_BKG_ERR", "E", "e-/s", self.flux_bkg_err),
+        ]
         for name in self._optional_column_data:
             key = name.upper()
-            cols.append(
-                fits.Column(
-                    name=key,
-                    array=self._optional_column_data[key],
-                    format=TPF_OPTIONAL_COLUMNS[key].get("format", ""),
-                    unit=TPF_OPTIONAL_COLUMNS[key].get("unit", ""),
-                    dim=TPF_OPTIONAL_COLUMNS[key].get("dim", ""),
+            if key in self._optional_column_specs:
+                colspec = self._optional_column_specs[key]
+            else:
+                colspec = TPF_OPTIONAL_COLUMNS[key]
+            columns.append(
+                (
+                    key,
+                    colspec.get("format", ""),
+                    colspec.get("unit", ""),
+                    np.asarray(self._optional_column_data[key]),
                 )
             )
 
-        coldefs = fits.ColDefs(cols)
-        hdu = fits.BinTableHDU.from_columns(coldefs)
+        # Image columns become sub-arrays, for which astropy sets TDIM itself
+        dtype = np.dtype(
+            [
+                (
+                    name,
+                    _column_dtype(fmt).newbyteorder(">"),
+                    np.shape(array)[1:],
+                )
+                for name, fmt, _, array in columns
+            ]
+        )
+        table = np.empty(self.n_cadences, dtype=dtype)
+        for name, _, _, array in columns:
+            table[name] = array
+
+        data = table.view(fits.FITS_rec)
+        for name, _, unit, _ in columns:
+            if unit:
+                data.columns[name].unit = unit
+        hdu = fits.BinTableHDU(data=data)
 
         # Set useful header keywords
         hdu.header["BJDREFI"] = 2457000
@@ -299,3 +327,8 @@ class TargetPixelFile:
         hdu = fits.ImageHDU(mask)
         hdu.header["EXTNAME"] = "APERTURE"
         return hdu
+
+
+def _column_dtype(fmt: str) -> np.dtype:
+    """Returns the numpy dtype of the elements of a FITS binary table column."""
+    return fits.Column(name="_", format=fmt).dtype.base
@@ -6,59 +6,112 @@ Use `save_tica_ffi_catalog(sector)` to create a catalog of TICA TESS FFI images.
 
 """
 import asyncio
-from urllib.error import HTTPError
 from pathlib import Path
 from typing import Union
 from functools import lru_cache
 
-from astropy.io.fits import Header
 from astropy.time import Time
 import pandas as pd
+import pyarrow.parquet as pq
 from pandas import DataFrame
 import tqdm
 import numpy as np
 
-from .image import TessImage
+from .image import TessImage, _default_http_client, _parse_header_keywords, _sync_call
 from .imagelist import TessImageList
-from . import DATADIR, log
+from . import CACHEDIR, DATADIR, crawler, log
 
 
 TICA_MAST_PREFIX = "https://archive.stsci.edu/hlsps/tica/"
 TICA_MOCK_PREFIX = "http://localhost:8040/mock/tica/"
 
+# Where are the URL lists of the TICA bundle scripts cached?
+TICA_BUNDLE_CACHEDIR = CACHEDIR / "tica-bundles"
 
-def list_tica_urls(sector=35) -> list:
+# Header keywords which are stored in the TICA image catalogs
+TICA_HEADER_KEYWORDS = ("CAMNUM", "CCDNUM", "MJD-BEG", "MJD-END", "CADENCE")
+
+# Number of connections to the archive to keep open when crawling headers;
+# this matches the number of concurrent reads allowed by `MAX_CONCURRENT_DOWNLOADS`
+MAX_CONCURRENT_HEADERS = 10
+
+
+def list_tica_urls(sector=35, refresh=False) -> list:
     """Returns a list of TESS images produced by the TICA pipeline.
 
     Details: https://archive.stsci.edu/hlsp/tica
+
+    The bundle scripts which list the images are cached on disk;
+    use `refresh=True` to download them again.
     """
-    urls = []
-    for orbit in [1, 2]:
-        for camera in [1, 2, 3, 4]:
-            for ccd in [1, 2, 3, 4]:
-                urls += _list_tica_urls_by_ccd(
-                    sector=sector, camera=camera, ccd=ccd, orbit=orbit
+    return _sync_call(async_list_tica_urls, sector=sector, refresh=refresh)
+
+
+async def async_list_tica_urls(sector=35, refresh=False) -> list:
+    """Returns a list of TESS images produced by the TICA pipeline.
+
+    The download scripts of all orbits, cameras, and ccds are fetched concurrently.
+    """
+    async with _default_http_client() as client:
+        results = await asyncio.gather(
+            *[
+                _async_list_tica_urls_by_ccd(
+                    sector=sector,
+                    camera=camera,
+                    ccd=ccd,
+                    orbit=orbit,
+                    client=client,
+                    refresh=refresh,
                 )
-    return urls
+                for orbit in [1, 2]
+                for camera in [1, 2, 3, 4]
+                for ccd in [1, 2, 3, 4]
+            ]
+        )
+    return [url for urls in results for url in urls]
 
 
-def _list_tica_urls_by_ccd(sector=35, camera=1, ccd=1, orbit=1) -> list:
+async def _async_list_tica_urls_by_ccd(
+    sector=35, camera=1, ccd=1, orbit=1, client=None, refresh=False
+) -> list:
+    bundle_name = (
+        f"hlsp_tica_tess_ffi_s{sector:04d}-o{orbit}-cam{camera}-ccd{ccd}_tess_v01_ffis"
+    )
+    cache_path = TICA_BUNDLE_CACHEDIR / f"{bundle_name}.txt"
+    if not refresh and cache_path.exists():
+        return list(_read_url_list(cache_path))
+
     bundle_url = (
-        f"https://archive.stsci.edu/hlsps/tica/bundles/s{sector:04d}/"
-        f"hlsp_tica_tess_ffi_s{sector:04d}-o{orbit}-cam{camera}-ccd{ccd}_tess_v01_ffis.sh"
+        f"https://archive.stsci.edu/hlsps/tica/bundles/s{sector:04d}/{bundle_name}.sh"
     )
-    try:
-        df = pd.read_fwf(bundle_url, colspecs=[(114, -1)], names=["url"])
-        return df.url.tolist()
-    except HTTPError:
-        # HTTP 404 means the sector is not available yet in the archive
-        return []
+    async with client.get(bundle_url) as resp:
+        if resp.status == 404:
+            # HTTP 404 means the sector is not available yet in the archive
+            return []
+        resp.raise_for_status()
+        text = await resp.text()
+    # Each line of the script is a `curl` command which ends with the URL
+    urls = [line[114:].strip() for line in text.splitlines() if len(line) > 114]
+
+    # Bundles do not change once published, so they can be cached indefinitely
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_text("\n".join(urls))
+    tmp_path.replace(cache_path)
+    _read_url_list.cache_clear()
+    return urls
+
+
+@lru_cache(maxsize=None)
+def _read_url_list(path: Path) -> tuple:
+    """Returns the URLs stored in a text file, one per line."""
+    return tuple(path.read_text().split())
 
 
-async def _get_tica_metadata_entry(url, sector=-1):
+async def _get_tica_metadata_entry(url, sector=-1, client=None):
     img = TessImage(url)
-    data_offset, hdrstr = await img._find_data_offset(return_header=True)
-    hdr = Header.fromstring(hdrstr)
+    data_offset, hdrstr = await img._find_data_offset(return_header=True, client=client)
+    hdr = _parse_header_keywords(hdrstr, TICA_HEADER_KEYWORDS)
     return {
         "path": url.replace("https://archive.stsci.edu/hlsps/tica/", ""),
         "sector": sector,  # not in FITS header!
@@ -66,20 +119,31 @@ async def _get_tica_metadata_entry(url, sector=-1):
         "ccd": hdr["CCDNUM"],
         "start": Time(hdr["MJD-BEG"], format="mjd").iso[:19],
         "stop": Time(hdr["MJD-END"], format="mjd").iso[:19],
+        "start_mjd": hdr["MJD-BEG"],
+        "stop_mjd": hdr["MJD-END"],
         "cadence": hdr["CADENCE"],
         "data_offset": data_offset,
     }
 
 
 async def async_get_tica_metadata(sector=35):
-    urls = list_tica_urls(sector)
-    flist = [_get_tica_metadata_entry(url, sector=sector) for url in urls]
-    tasks = [asyncio.create_task(f) for f in flist]
-    for t in tqdm.tqdm(
-        asyncio.as_completed(tasks), total=len(tasks), desc="Reading headers"
-    ):
-        await t
-    return pd.DataFrame([t.result() for t in tasks])
+    urls = await async_list_tica_urls(sector)
+    # All headers are read through one session, which keeps its connections
+    # to the archive open, rather than through a new session for every file
+    async with _default_http_client(limit=MAX_CONCURRENT_HEADERS) as client:
+        tasks = [
+            asyncio.create_task(
+                _get_tica_metadata_entry(url, sector=sector, client=client)
+            )
+            for url in urls
+        ]
+        # The rows are collected in order of completion; the catalog is sorted on save
+        records = []
+        for t in tqdm.tqdm(
+            asyncio.as_completed(tasks), total=len(tasks), desc="Reading headers"
+        ):
+            records.append(await t)
+    return pd.DataFrame.from_records(records)
 
 
 def _tica_catalog_path(sector: int) -> Path:
@@ -96,8 +160,23 @@ def save_tica_ffi_catalog(sector, path=None, overwrite=False) -> DataFrame:
         )
         return None
     df = asyncio.run(async_get_tica_metadata(sector=sector))
+    if df.empty:
+        log.warning(f"Skipping sector {sector}: no TICA images were found.")
+        return None
+    # Sort once here, so that readers of the catalog don't have to
+    df = df.sort_values("path").reset_index(drop=True)
+    # Narrow integer types make the file smaller and faster to read
+    df = df.astype(
+        {
+            "sector": "int32",
+            "camera": "uint8",
+            "ccd": "uint8",
+            "cadence": "int32",
+            "data_offset": "int32",
+        }
+    )
     log.info(f"Started writing {path}")
-    df.to_parquet(path, compression="gzip")
+    df.to_parquet(path, engine="pyarrow", compression="zstd", compression_level=3)
     log.info(f"Finished writing {path}")
     return df
 
@@ -112,30 +191,33 @@ def list_tica_images(
     """Returns a list of TICA FFI images."""
     df = _load_tica_ffi_catalog(sector=sector)
     if camera:
-        df = df[df.camera == camera]
+        df = df[df.camera.values == camera]
     if ccd:
-        df = df[df.ccd == ccd]
+        df = df[df.ccd.values == ccd]
     if time:
-        if isinstance(time, str):
-            time = Time(time)
-        begin = Time(np.array(df.start, dtype=str))
-        end = Time(np.array(df.stop, dtype=str))
-        mask = (time >= begin) & (time <= end)
+        mjd = Time(time).utc.mjd
+        mask = (df.start_mjd.values <= mjd) & (mjd <= df.stop_mjd.values)
+        if not any(mask):
+            return TessImageList([])
         df = df[mask]
 
     if provider == "mock":
-        df["path"] = TICA_MOCK_PREFIX + df["path"]
+        prefix = TICA_MOCK_PREFIX
     else:
-        df["path"] = TICA_MAST_PREFIX + df["path"]
+        prefix = TICA_MAST_PREFIX
 
     # Add time column (TODO: move this to save_catalog)
-    duration = Time(df.stop.iloc[0]) - Time(df.start.iloc[0])
-    timeobj = Time(df.start.values.astype(str)) + (duration / 2)
-    df["time"] = timeobj.iso
-
-    # TODO: have this be part of save_catalog
-    df["quality"] = np.zeros(len(df), dtype=int)
-    df["cadenceno"] = df["cadence"]
+    duration = df.stop_mjd.values[0] - df.start_mjd.values[0]
+    timeobj = Time(df.start_mjd.values + duration / 2, format="mjd", scale="utc")
+
+    # Use `assign` to avoid modifying the cached catalog in place
+    df = df.assign(
+        path=prefix + df["path"],
+        time=timeobj.iso,
+        # TODO: have this be part of save_catalog
+        quality=np.zeros(len(df), dtype=int),
+        cadenceno=df["cadence"],
+    )
 
     return TessImageList.from_catalog(df)
 
@@ -144,5 +226,12 @@ def list_tica_images(
 def _load_tica_ffi_catalog(sector: int) -> DataFrame:
     path = _tica_catalog_path(sector=sector)
     log.debug(f"Reading {path}")
-    # TODO: move sort_values to `save_catalog`
-    return pd.read_parquet(path).sort_values("path")
+    # `self_destruct` frees the Arrow buffers while the DataFrame is being built
+    df = pq.read_table(path).to_pandas(self_destruct=True)
+    # Catalogs written by `save_tica_ffi_catalog` are already sorted by path
+    if not df.path.is_monotonic_increasing:
+        df = df.sort_values("path")
+    # Catalogs created by older versions of the crawler lack the MJD columns
+    if "start_mjd" not in df:
+        crawler._add_mjd_columns(df)
+    return df
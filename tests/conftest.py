@@ -0,0 +1,32 @@
+from astropy.io import fits
+import lightkurve as lk
+import pytest
+
+from tess_cloud import TessImage, list_images
+
+
+# A calibrated FFI which is available both on AWS S3 and at MAST
+FFI_URL_S3 = "s3://stpubdata/tess/public/ffi/s0012/2019/142/2-1/tess2019142115932-s0012-2-1-0144-s_ffic.fits"
+FFI_URL_MAST = "https://archive.stsci.edu/missions/tess/ffi/s0012/2019/142/2-1/tess2019142115932-s0012-2-1-0144-s_ffic.fits"
+
+
+@pytest.fixture(scope="module")
+def tess_image():
+    return TessImage(url=FFI_URL_S3)
+
+
+@pytest.fixture(scope="module")
+def mast_data():
+    """Pixel data of the FFI, downloaded from MAST only once per module."""
+    return fits.getdata(FFI_URL_MAST, memmap=True)
+
+
+@pytest.fixture(scope="module")
+def tesscut():
+    """Returns a (3, 3) TessCut TPF of Pi Men and the first two images it covers."""
+    tpf = lk.search_tesscut("Pi Men", sector=31).download(
+        cutout_size=(3, 3), quality_bitmask=None
+    )
+    # The image catalog is cached in memory, so this does not parse it again
+    imglist = list_images(sector=tpf.sector, camera=tpf.camera, ccd=tpf.ccd)
+    return tpf, imglist[0:2]
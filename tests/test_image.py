@@ -1,6 +1,7 @@
 import numpy as np
+from astropy.io import fits
 
-from tess_cloud.image import TessImage, _compute_lower_left_corner
+from tess_cloud.image import TessImage, _compute_lower_left_corner, _parse_header
 from tess_cloud.imagelist import TessImageList
 
 
@@ -30,3 +31,18 @@ def test_compute_lower_left_corner():
     assert _compute_lower_left_corner(10, 20, shape=(4, 4)) == (8, 18)
     assert _compute_lower_left_corner(10, 20, shape=(1, 2)) == (10, 19)
     assert _compute_lower_left_corner(10, 20, shape=(2, 1)) == (9, 20)
+
+
+def test_parse_header():
+    """Does the fast header parser agree with astropy?"""
+    hdr = fits.Header()
+    hdr["SIMPLE"] = True
+    hdr["NAXIS"] = 2
+    hdr["MJD-BEG"] = 59000.123456789
+    hdr["OBJECT"] = "it's a / test"
+    hdr["SIMDATA"] = False
+    hdr["COMMENT"] = "commentary cards are ignored"
+    result = _parse_header(hdr.tostring().encode("ascii"))
+    assert list(result.keys()) == ["SIMPLE", "NAXIS", "MJD-BEG", "OBJECT", "SIMDATA"]
+    for key in result:
+        assert result[key] == hdr[key]
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from tess_cloud.crawler import _add_mjd_columns
+from tess_cloud.spoc import list_spoc_images
+from tess_cloud.tica import list_tica_images
+
+
+def test_list_spoc_images_by_time():
+    """Does the time filter select the image which was taken at that time?"""
+    imglist = list_spoc_images(sector=12, camera=2, ccd=1, time="2019-05-25 12:00")
+    assert len(imglist) == 1
+    assert imglist[0].filename == "tess2019145112931-s0012-2-1-0144-s_ffic.fits"
+    # No images should be returned for a time outside of the sector
+    assert len(list_spoc_images(sector=12, camera=2, ccd=1, time="2030-01-01")) == 0
+
+
+def test_list_tica_images_by_time():
+    imglist = list_tica_images(sector=27, camera=1, ccd=1, time="2020-07-10 10:00")
+    assert len(imglist) == 1
+    assert (
+        imglist[0].filename
+        == "hlsp_tica_tess_ffi_s0027-o1-00117137-cam1-ccd1_tess_v01_img.fits"
+    )
+    assert len(list_tica_images(sector=27, camera=1, ccd=1, time="2030-01-01")) == 0
+
+
+def test_add_mjd_columns():
+    """Are the MJD columns of catalogs lacking them computed correctly?"""
+    df = pd.DataFrame(
+        {"start": ["2019-05-25 11:19:31"], "stop": ["2019-05-25 11:49:31"]}
+    )
+    _add_mjd_columns(df)
+    assert abs(df.start_mjd[0] - 58628.47189) < 1e-5
+    assert abs((df.stop_mjd[0] - df.start_mjd[0]) * 1440 - 30) < 1e-6
@@ -0,0 +1,10 @@
+from tess_cloud import get_s3_uri
+
+
+def test_get_s3_uri():
+    """The S3 URI of an FFI can be derived without downloading the manifest."""
+    filename = "tess2019142115932-s0012-2-1-0144-s_ffic.fits"
+    assert (
+        get_s3_uri(filename)
+        == "s3://stpubdata/tess/public/ffi/s0012/2019/142/2-1/" + filename
+    )
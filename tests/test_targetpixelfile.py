@@ -0,0 +1,33 @@
+import numpy as np
+
+from tess_cloud.targetpixelfile import TargetPixelFile
+
+
+def test_write_read_roundtrip(tmp_path):
+    """Can a TPF be read back after having been written?"""
+    flux = np.arange(3 * 4 * 5, dtype=np.float32).reshape((3, 4, 5))
+    tpf = TargetPixelFile(time=np.arange(3.0), flux=flux, flux_err=flux / 10)
+    tpf.add_column(name="QUALITY", array=np.array([0, 1, 0]))
+    path = tmp_path / "tpf.fits"
+    tpf.write(path)
+
+    tpf2 = TargetPixelFile.read(path)
+    assert tpf2.flux.shape == (3, 4, 5)
+    assert (tpf2.time == tpf.time).all()
+    assert (tpf2.flux == flux).all()
+    assert (tpf2.flux_err == flux / 10).all()
+    assert (tpf2._optional_column_data["QUALITY"] == [0, 1, 0]).all()
+    tpf2.close()
+
+
+def test_write_compressed(tmp_path):
+    """Is a TPF written with a ".gz" suffix gzip-compressed?"""
+    flux = np.ones((3, 4, 5), dtype=np.float32)
+    tpf = TargetPixelFile(time=np.arange(3.0), flux=flux, flux_err=flux / 10)
+    path = tmp_path / "tpf.fits.gz"
+    tpf.write(path)
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+
+    tpf2 = TargetPixelFile.read(path)
+    assert (tpf2.flux == flux).all()
+    tpf2.close()